@@ -46,37 +46,22 @@ def _setup_page():
     st.divider()
 
 
-def extract_text_from_pdf(pdf_file) -> str:
-    """Extract text from uploaded PDF file."""
-    with fitz.open(stream=pdf_file.read(), filetype="pdf") as doc:
-        text = ""
-        for page in doc:
-            text += page.get_text()
+# Keep in sync with _PDF_TEXT_FLAGS in src/app.py (default flags minus
+# ligature preservation, so "ﬁ" extracts as "fi")
+PDF_TEXT_FLAGS = fitz.TEXTFLAGS_TEXT & ~fitz.TEXT_PRESERVE_LIGATURES
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def extract_text_from_pdf(pdf_bytes: bytes) -> str:
+    """Extract text from uploaded PDF bytes (cached across reruns)."""
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        text = "".join(
+            page.get_text("text", flags=PDF_TEXT_FLAGS, sort=False)
+            for page in doc
+        )
     return text.strip()
 
 
-def extract_keywords_from_jd(jd_text: str) -> list:
-    """Extract keywords from JD (simple word extraction)."""
-    common_keywords = [
-        "python", "java", "javascript", "typescript", "react", "angular", "vue",
-        "node", "nodejs", "express", "django", "flask", "fastapi", "spring",
-        "aws", "azure", "gcp", "docker", "kubernetes", "k8s", "terraform",
-        "sql", "mysql", "postgresql", "mongodb", "redis", "elasticsearch",
-        "git", "github", "gitlab", "ci/cd", "jenkins", "devops", "agile",
-        "rest", "api", "microservices", "linux", "bash", "shell",
-        "machine learning", "ml", "ai", "data science", "pandas", "numpy",
-        "html", "css", "tailwind", "bootstrap", "figma", "ui/ux"
-    ]
-
-    jd_lower = jd_text.lower()
-    found_keywords = []
-    for keyword in common_keywords:
-        if keyword in jd_lower:
-            found_keywords.append(keyword)
-
-    return found_keywords if found_keywords else jd_text.replace(",", " ").split()[:20]
-
-
 # API URL - uses localhost since both run in same container
 API_URL = "http://localhost:8000"
 
@@ -108,9 +93,9 @@ else:
     jd_file = st.file_uploader("Upload JD (PDF or TXT)", type=["pdf", "txt"], key="jd")
     if jd_file:
         if jd_file.type == "application/pdf":
-            jd_text = extract_text_from_pdf(jd_file)
+            jd_text = extract_text_from_pdf(jd_file.getvalue())
         else:
-            jd_text = jd_file.read().decode("utf-8")
+            jd_text = jd_file.getvalue().decode("utf-8")
         st.success(f"JD loaded: {len(jd_text)} characters")
 
 st.divider()
@@ -130,11 +115,7 @@ if analyze_button:
         with st.spinner("Analyzing your resume..."):
             try:
                 # Extract resume text
-                resume_file.seek(0)  # Reset file pointer
-                resume_text = extract_text_from_pdf(resume_file)
-
-                # Extract keywords from JD
-                keywords = extract_keywords_from_jd(jd_text)
+                resume_text = extract_text_from_pdf(resume_file.getvalue())
 
                 # Call backend API (uses form data, not JSON)
                 response = requests.post(
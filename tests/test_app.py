@@ -1,5 +1,16 @@
 """Unit tests for ATS Keyword Matcher."""
-from src.app import extract_keywords, calculate_ats_score, get_score_label
+import asyncio
+
+import fitz
+
+from src.app import (
+    analyze_text,
+    extract_keywords,
+    extract_text_from_pdf,
+    calculate_ats_score,
+    get_score_label,
+    health_check,
+)
 
 
 def test_extract_keywords_filters_stop_words():
@@ -29,6 +40,49 @@ def test_extract_keywords_case_insensitive():
     assert len(keywords) == 1
 
 
+def test_extract_keywords_returns_cached_frozenset():
+    """Test that repeated extraction reuses one immutable keyword set."""
+    first = extract_keywords("Python Docker Kubernetes")
+    second = extract_keywords("Python Docker Kubernetes")
+
+    assert isinstance(first, frozenset)
+    assert second is first
+    assert second == {"python", "docker", "kubernetes"}
+
+
+def test_extract_keywords_does_not_cache_large_texts():
+    """Test that texts above the cache size limit are re-extracted each call."""
+    text = "Python Docker Kubernetes " * 10_000
+
+    first = extract_keywords(text)
+    second = extract_keywords(text)
+
+    assert second == first == {"python", "docker", "kubernetes"}
+    assert second is not first
+
+
+def test_extract_keywords_non_ascii_word_boundaries():
+    """Test that ASCII runs inside accented words are not split out."""
+    keywords = extract_keywords("Caf\u00e9 na\u00efve Python")
+
+    assert keywords == {"python"}
+
+
+def test_extract_text_from_pdf_expands_ligatures():
+    """Test that ligature glyphs are extracted as plain letters."""
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_font(fontname="F0", fontbuffer=fitz.Font("cjk").buffer)
+    page.insert_text((40, 60), "Pro\ufb01le: Python", fontname="F0")
+    pdf_bytes = doc.tobytes()
+    doc.close()
+
+    text = extract_text_from_pdf(pdf_bytes)
+
+    assert "Profile" in text
+    assert "profile" in extract_keywords(text)
+
+
 def test_calculate_ats_score_perfect_match():
     """Test ATS score calculation with perfect match."""
     resume = {"python", "java", "docker"}
@@ -75,6 +129,18 @@ def test_calculate_ats_score_empty_jd():
     assert result["score"] == 0.0
 
 
+def test_calculate_ats_score_accepts_any_set_and_returns_frozensets():
+    """Test scoring over non-set inputs and the frozenset result type."""
+    result = calculate_ats_score({"python": 1}.keys(), {"python": 1, "java": 2}.keys())
+    empty = calculate_ats_score({"python"}, set())
+
+    assert result["score"] == 50.0
+    assert result["matched"] == {"python"}
+    assert result["missing"] == {"java"}
+    for keywords in (result["matched"], result["missing"], empty["matched"], empty["missing"]):
+        assert isinstance(keywords, frozenset)
+
+
 def test_get_score_label_excellent():
     """Test score label for excellent match."""
     assert get_score_label(85.0) == "Excellent Match"
@@ -127,3 +193,25 @@ def test_real_resume_jd_scenario():
     assert "python" in result["matched"]
     assert "docker" in result["matched"]
     assert "kubernetes" in result["matched"]
+
+
+def test_analyze_text_trims_keywords_to_top_k():
+    """Test that keyword lists are sorted and capped at 50 matched / 30 missing."""
+    words = [f"tech{chr(97 + i // 26)}{chr(97 + i % 26)}" for i in range(120)]
+    resume_text = " ".join(words[:60])
+    jd_text = " ".join(reversed(words))
+
+    result = asyncio.run(analyze_text(resume_text=resume_text, job_description=jd_text))
+
+    assert result.matched_keywords == sorted(words[:60])[:50]
+    assert result.missing_keywords == sorted(words[60:])[:30]
+    assert result.total_matched == 60
+    assert result.total_jd_keywords == 120
+
+
+def test_health_check_returns_status_up():
+    """Test the pre-encoded health check payload."""
+    response = asyncio.run(health_check())
+
+    assert response.media_type == "application/json"
+    assert response.body == b'{"status":"up"}'